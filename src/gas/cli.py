@@ -1,13 +1,10 @@
 import sys
 
 import click
-from rich.console import Console
 
 from gas.commands.config import config_cmd
-from gas.commands.commit import generate_commit_message
-from gas.core.git import get_git_diff
-
-console = Console()
+from gas.core.config import config
+from gas.core.git import get_git_diff, truncate_diff
 
 
 @click.group()
@@ -19,7 +16,8 @@ def cli():
 
 @cli.command()
 @click.option("--detailed", "-d", default=False, help="Show detailed explanation")
-def explain(detailed):
+@click.option("--cache/--no-cache", default=True, help="Reuse cached AI responses")
+def explain(detailed, cache):
     """Explain Git diff changes in plain English.
 
     By default, explains the current working directory changes.
@@ -29,13 +27,15 @@ def explain(detailed):
     from gas.commands.explain import explain_diff
 
     # Check if we're receiving input from a pipe
+    max_chars = config.ai.max_diff_chars
     if not sys.stdin.isatty():
-        diff_content = sys.stdin.read()
+        diff_content = sys.stdin.read(max_chars + 1) if max_chars else sys.stdin.read()
+        diff_content = truncate_diff(diff_content, max_chars)
     else:
         # No pipe, use get_git_diff
-        diff_content = get_git_diff()
+        diff_content = get_git_diff(max_chars=max_chars)
 
-    explain_diff(diff_content, detailed=detailed)
+    explain_diff(diff_content, detailed=detailed, use_cache=cache)
 
 
 @cli.command()
@@ -46,9 +46,12 @@ def explain(detailed):
     help="Type of change (conventional commits)",
 )
 @click.option("--edit/--no-edit", default=True, help="Open editor before committing")
-def commit(type, edit):
+@click.option("--cache/--no-cache", default=True, help="Reuse cached AI responses")
+def commit(type, edit, cache):
     """Generate a commit message based on staged changes."""
-    generate_commit_message(commit_type=type, edit=edit)
+    from gas.commands.commit import generate_commit_message
+
+    generate_commit_message(commit_type=type, edit=edit, use_cache=cache)
 
 
 # Add the config command group
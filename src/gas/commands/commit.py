@@ -1,28 +1,77 @@
 import subprocess
-from typing import Optional
+import textwrap
+from typing import Iterator, List, Optional
 
 import click
-from rich.console import Console
 from rich.prompt import Confirm
 from rich.status import Status
 
-from gas.core.ai import get_ai_client
-from gas.core.git import get_staged_changes
+from gas.core.ai import AIClient, get_ai_client
+from gas.core.gencache import GenCache
+from gas.core.git import (
+    get_changed_files,
+    get_renamed_files,
+    get_staged_changes,
+    is_import_reorder_only,
+    is_whitespace_only,
+    split_hunks,
+)
 from gas.core.config import config
+from gas.core.console import console
 
-console = Console()
 
+# Prompt instructions, dedented once at import time
 
-def generate_commit_message(commit_type: Optional[str] = None, edit: bool = True) -> None:
+_COMMIT_GUIDELINES = textwrap.dedent("""
+    You are an expert at writing Git commit messages.
+    Please generate a clear and concise commit message for the following changes.
+    Follow these guidelines:
+    - Use the imperative mood ("Add feature" not "Added feature")
+    - First line should be a short summary (50 chars or less)
+    - If needed, add a detailed description after a blank line
+    - Be specific about what changed and why
+    - Focus on the intention of the change, not just what files changed
+    - Do not include headers or other formatting symbols like *, #, ```, etc.
+
+    Follow the format:
+    Commit message short summary
+
+    Detailed description of the changes. Can be empty or multiple paragraphs.
+""").strip()
+
+# Formatted with the commit type
+_CONVENTIONAL_COMMIT_RULES = textwrap.dedent("""
+    Use the conventional commit format with type '{commit_type}' and follow these rules:
+    - Format: {commit_type}([scope]): description
+    - A scope MAY be provided after a type. A scope MUST consist of a noun describing
+      a section of the codebase surrounded by parenthesis, e.g., fix(parser):
+    - Description should clearly state the purpose
+    - Add a body if more context is needed
+    - Add breaking change warnings if applicable
+""")
+
+# Response format used when generating one description per file
+_HUNK_RESPONSE_FORMAT = textwrap.dedent("""
+    Instead of the format above, respond only with a JSON object of this form:
+    {"summary": "<short summary line>", "changes": {"<change number>": "<one-line description>"}}
+    Write one description for each numbered change below. The summary line must cover
+    all changes, including the already described ones.
+""")
+
+
+def generate_commit_message(
+    commit_type: Optional[str] = None, edit: bool = True, use_cache: bool = True
+) -> None:
     """Generate a commit message based on staged changes.
 
     Args:
         commit_type: Type of change (conventional commits)
         edit: Whether to open editor before committing
+        use_cache: Whether to reuse a cached AI response
     """
     # Get staged changes
     with Status("[bold blue]📝 Reading staged changes...", spinner="dots") as status:
-        staged_changes = get_staged_changes()
+        staged_changes = get_staged_changes(max_chars=config.ai.max_diff_chars)
 
         if not staged_changes:
             status.update("[yellow]⚠️ No changes found")
@@ -31,11 +80,19 @@ def generate_commit_message(commit_type: Optional[str] = None, edit: bool = True
 
     try:
         # Generate commit message
-        message = _generate_message(staged_changes, commit_type)
+        chunks = _generate_message(staged_changes, commit_type, use_cache)
+
+        # Wait for the first chunk so the client's status is gone before printing
+        parts = [next(chunks, "").lstrip()]
 
-        # Show the message and confirm
+        # Show the message as it is generated and confirm
         console.print("\n[bold green]✨ Generated commit message:[/bold green]")
-        console.print(message)
+        console.print(parts[0], end="", markup=False, highlight=False, soft_wrap=True)
+        for chunk in chunks:
+            parts.append(chunk)
+            console.print(chunk, end="", markup=False, highlight=False, soft_wrap=True)
+        console.print()
+        message = "".join(parts).strip()
 
         if edit:
             # Save message to temporary file and open editor
@@ -50,55 +107,144 @@ def generate_commit_message(commit_type: Optional[str] = None, edit: bool = True
         console.print(f"[red]❌ Error generating commit message: {str(e)}[/red]")
 
 
-def _generate_message(changes: str, commit_type: Optional[str]) -> str:
-    """Generate a commit message using AI."""
-    prompt = _build_commit_prompt(changes, language=config.user.language, commit_type=commit_type)
+def _generate_message(
+    changes: str, commit_type: Optional[str], use_cache: bool = True
+) -> Iterator[str]:
+    """Generate a commit message using AI, returning its chunks as they are generated."""
+    # Trivial changes don't need the model
+    message = _try_local_summary(changes, commit_type)
+    if message is not None:
+        return iter([message])
 
     client = get_ai_client()
-    response = client.generate(
-        prompt=prompt,
+    client.use_cache = use_cache
+
+    template = _build_commit_template(language=config.user.language, commit_type=commit_type)
+
+    # Multi-file changes can reuse the descriptions of files seen in earlier requests
+    hunks = split_hunks(changes)
+    if config.ai.hunk_cache_enabled and len(hunks) > 1:
+        message = _generate_message_by_hunk(client, template, hunks, use_cache)
+        if message:
+            return iter([message])
+
+    return client.generate(
+        prompt=_build_commit_prompt(
+            changes, language=config.user.language, commit_type=commit_type
+        ),
         max_tokens=config.ai.max_tokens,
         temperature=config.ai.temperature,
+        payload=changes,
+        stream=True,
     )
 
-    return response.strip()
 
+def _try_local_summary(changes: str, commit_type: Optional[str] = None) -> Optional[str]:
+    """Build a commit message locally for renames, whitespace and import-order changes.
 
-def _build_commit_prompt(
-    changes: str, language: str = "en", commit_type: Optional[str] = None
-) -> str:
-    """Build the prompt for commit message generation."""
-    language_prompt = "" if language == "en" else f"Please respond in {language} language.\n\n"
+    Diffs shorter than the min_diff_chars setting are also summarized locally.
 
-    base_prompt = f"""{language_prompt}You are an expert at writing Git commit messages.
-    Please generate a clear and concise commit message for the following changes.
-    Follow these guidelines:
-    - Use the imperative mood ("Add feature" not "Added feature")
-    - First line should be a short summary (50 chars or less)
-    - If needed, add a detailed description after a blank line
-    - Be specific about what changed and why
-    - Focus on the intention of the change, not just what files changed
-    - Do not include headers or other formatting symbols like *, #, ```, etc.
+    Returns:
+        The commit message, or None if the changes need the model
+    """
+    files = ", ".join(get_changed_files(changes))
+    renames = get_renamed_files(changes)
 
-    Follow the format:
-    Commit message short summary
+    if len(renames) == 1:
+        summary = "Rename {} to {}".format(*renames[0])
+    elif renames:
+        details = "\n".join(f"- {old} -> {new}" for old, new in renames)
+        summary = f"Rename {len(renames)} files\n\n{details}"
+    elif is_whitespace_only(changes):
+        summary = f"Fix whitespace in {files}"
+    elif is_import_reorder_only(changes):
+        summary = f"Reorder imports in {files}"
+    elif len(changes) < config.ai.min_diff_chars:
+        summary = f"Update {files}\n\n{changes}"
+    else:
+        return None
 
-    Detailed description of the changes. Can be empty or multiple paragraphs.
+    if commit_type:
+        summary = f"{commit_type}: {summary[0].lower()}{summary[1:]}"
+    return summary
+
+
+def _generate_message_by_hunk(
+    client: AIClient, template: str, hunks: List[str], use_cache: bool = True
+) -> Optional[str]:
+    """Generate a commit message describing each hunk, reusing cached descriptions.
+
+    Only the hunks without a cached description are sent to the model. Without
+    use_cache, every hunk is described again. Returns None if the model response
+    cannot be parsed.
     """
+    cache = GenCache(max_entries=config.ai.cache_max_entries)
+    template_id = cache.template_id(template, config.ai.model, config.ai.temperature)
+
+    if use_cache:
+        fragments = [cache.get_fragment(template_id, hunk) for hunk in hunks]
+        summary = cache.get_summary(template_id, hunks)
+    else:
+        fragments = [None] * len(hunks)
+        summary = None
 
+    if summary is None or None in fragments:
+        prompt = _build_hunk_prompt(template, hunks, fragments)
+        response = client.generate(
+            prompt=prompt,
+            max_tokens=config.ai.max_tokens,
+            temperature=config.ai.temperature,
+        )
+
+        try:
+            result = client._extract_json(response)
+            summary = str(result["summary"]).strip()
+            descriptions = result.get("changes") or {}
+            for i, hunk in enumerate(hunks):
+                if fragments[i] is None:
+                    fragments[i] = str(descriptions[str(i + 1)]).strip()
+                    cache.put_fragment(template_id, hunk, fragments[i])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+        cache.put_summary(template_id, hunks, summary)
+
+    body = "\n".join(f"- {fragment}" for fragment in fragments)
+    return f"{summary}\n\n{body}"
+
+
+def _build_commit_template(language: str = "en", commit_type: Optional[str] = None) -> str:
+    """Build the static part of the commit prompt, without the changes."""
+    parts = [_COMMIT_GUIDELINES]
+    if language != "en":
+        parts.insert(0, f"Please respond in {language} language.\n")
     if commit_type:
-        base_prompt += f"""
-        Use the conventional commit format with type '{commit_type}' and follow these rules:
-        - Format: {commit_type}([scope]): description
-        - A scope MAY be provided after a type. A scope MUST consist of a noun describing a section of the codebase surrounded by parenthesis, e.g., fix(parser):
-        - Description should clearly state the purpose
-        - Add a body if more context is needed
-        - Add breaking change warnings if applicable
-        """
+        parts.append(_CONVENTIONAL_COMMIT_RULES.format(commit_type=commit_type))
+    return "\n".join(parts)
+
 
+def _build_commit_prompt(
+    changes: str, language: str = "en", commit_type: Optional[str] = None
+) -> str:
+    """Build the prompt for commit message generation."""
+    base_prompt = _build_commit_template(language=language, commit_type=commit_type)
     return f"{base_prompt}\n\nChanges:\n{changes}"
 
 
+def _build_hunk_prompt(template: str, hunks: List[str], fragments: List[Optional[str]]) -> str:
+    """Build a prompt asking for a summary plus one description per uncached hunk."""
+    described = [f"- {fragment}" for fragment in fragments if fragment is not None]
+    numbered = [f"Change {i + 1}:\n{hunk}" for i, hunk in enumerate(hunks) if fragments[i] is None]
+
+    parts = [template, _HUNK_RESPONSE_FORMAT]
+    if described:
+        parts.append("\nAlready described changes:\n" + "\n".join(described))
+    if numbered:
+        parts.append("\nChanges:\n" + "\n\n".join(numbered))
+
+    return "\n".join(parts)
+
+
 def _edit_message(message: str) -> str:
     """Open the default editor to edit the commit message."""
     edited = click.edit(message)
@@ -1,12 +1,14 @@
-from typing import Optional
+import functools
+import operator
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from gas.core.config import config, CONFIG_PATHS
+from gas.core.console import console
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.table import Table
 
 
 @click.group()
@@ -66,34 +68,30 @@ def get(key: Optional[str]):
             value = config.get_value(key)
             console.print(f"{key} = {value}")
         else:
-            # Show all config values in a table
-            table = Table(title="Current Configuration")
-            table.add_column("Setting", style="cyan")
-            table.add_column("Value", style="green")
-            table.add_column("Source", style="yellow")
-
             # Get values from both scopes
             global_config = config._load_file(CONFIG_PATHS["global"]) or {}
             local_config = config._load_file(CONFIG_PATHS["local"]) or {}
 
-            for option in config.list_options():
-                path = option["path"]
-                value = config.get_value(path)
-
-                # Determine source
-                in_local = _get_nested_value(local_config, path.split(".")) is not None
-                in_global = _get_nested_value(global_config, path.split(".")) is not None
+            # Serialize once instead of once per setting
+            values = config.model_dump()
 
-                if in_local:
-                    source = "local"
-                elif in_global:
-                    source = "global"
-                else:
-                    source = "default"
+            rows = [
+                (
+                    option["path"],
+                    str(_get_nested_value(values, option["keys"])),
+                    _get_source(option["keys"], local_config, global_config),
+                )
+                for option in config.list_options()
+            ]
 
-                table.add_row(path, str(value), source)
-
-            console.print(table)
+            # Show all config values in a table
+            console.print(
+                _build_table(
+                    "Current Configuration",
+                    [("Setting", "cyan"), ("Value", "green"), ("Source", "yellow")],
+                    rows,
+                )
+            )
 
     except ValueError as e:
         console.print(f"[red]Error: {str(e)}[/red]")
@@ -103,21 +101,44 @@ def get(key: Optional[str]):
 @config_cmd.command()
 def list():
     """List all available configuration options."""
-    table = Table(title="Available Configuration Options")
-    table.add_column("Setting", style="cyan")
-    table.add_column("Description", style="green")
-    table.add_column("Default", style="yellow")
-
-    for option in config.list_options():
-        table.add_row(option["path"], option["description"], option["default"])
-
-    console.print(table)
-
-
-def _get_nested_value(d: dict, keys: list) -> Optional[str]:
-    """Get a nested dictionary value using a list of keys."""
-    for key in keys:
-        if not isinstance(d, dict) or key not in d:
-            return None
-        d = d[key]
-    return d
+    rows = [
+        (option["path"], option["description"], option["default"])
+        for option in config.list_options()
+    ]
+
+    console.print(
+        _build_table(
+            "Available Configuration Options",
+            [("Setting", "cyan"), ("Description", "green"), ("Default", "yellow")],
+            rows,
+        )
+    )
+
+
+def _build_table(
+    title: str, columns: Sequence[Tuple[str, str]], rows: Sequence[Sequence[str]]
+) -> "Table":
+    """Build a table from (header, style) column definitions and precomputed rows."""
+    from rich.table import Column, Table
+
+    table = Table(*(Column(header, style=style) for header, style in columns), title=title)
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+def _get_source(keys: Sequence[str], local_config: dict, global_config: dict) -> str:
+    """Determine which config scope a setting comes from."""
+    if _get_nested_value(local_config, keys) is not None:
+        return "local"
+    if _get_nested_value(global_config, keys) is not None:
+        return "global"
+    return "default"
+
+
+def _get_nested_value(d: dict, keys: Sequence[str]) -> Optional[Any]:
+    """Get a nested dictionary value using a sequence of keys."""
+    try:
+        return functools.reduce(operator.getitem, keys, d)
+    except (KeyError, TypeError):
+        return None
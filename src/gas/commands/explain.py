@@ -1,21 +1,65 @@
+import asyncio
 import textwrap
-from rich.console import Console
+from typing import List, Optional
+
+from rich.live import Live
 from rich.panel import Panel
 from rich.status import Status
+from rich.text import Text
 
-from gas.core.ai import get_ai_client
-from gas.core.git import parse_git_diff
+from gas.core.ai import AIClient, get_ai_client
+from gas.core.git import (
+    get_changed_files,
+    get_renamed_files,
+    is_import_reorder_only,
+    is_whitespace_only,
+    parse_git_diff,
+    split_hunks,
+)
 from gas.core.config import config
+from gas.core.console import console
+
+
+# Prompt instructions, dedented once at import time
+
+# Core instruction for the AI
+_CORE_INSTRUCTION = textwrap.dedent("""
+    You are an expert Git assistant. Analyze the following Git diff and explain the
+    changes in a clear, structured way that helps developers understand them quickly.
+
+    Your explanation should include:
+    1. **Summary**: A concise one- or two-sentence overview of the main purpose.
+    2. **Files Affected**: A list of key files or directories changed.
+    3. **Details**: For each change, describe:
+       - What was modified or added
+       - Why the change was made
+    4. **Impact & Risks**: Potential side effects, regressions, or areas to review.
+    5. **Best Practices / Patterns**: Any design patterns, conventions, or best practices used.
+""").strip()
+
+# Additional instructions for detailed explanations
+_DETAILED_INSTRUCTION = textwrap.dedent("""
+    -- Detailed Analysis --
+    6. **Technical Specifics**: Explain complex logic, edge cases, and performance considerations.
+    7. **Dependencies & Affected Areas**: Note related modules or features that might be impacted.
+    8. **References**: Link to relevant documentation, code comments, or design docs if available.
+""").strip()
 
-console = Console()
+# Instruction for summarizing a single file of a multi-file diff
+_HUNK_INSTRUCTION = textwrap.dedent("""
+    You are an expert Git assistant. Summarize the following changes to a single file
+    in a few sentences: what was modified or added, why, and any potential risks.
+    Do not add headers or introductory text.
+""").strip()
 
 
-def explain_diff(diff_content: str, detailed: bool = False) -> None:
+def explain_diff(diff_content: str, detailed: bool = False, use_cache: bool = True) -> None:
     """Explain the Git diff using AI.
 
     Args:
         diff_content: The raw git diff content
         detailed: Whether to provide a detailed explanation
+        use_cache: Whether to reuse a cached AI response
     """
     if not diff_content.strip():
         console.print("[yellow]No changes to explain[/yellow]")
@@ -24,66 +68,144 @@ def explain_diff(diff_content: str, detailed: bool = False) -> None:
     # Parse the git diff to get structured changes
     with Status("[bold blue]📝 Analyzing changes...", spinner="dots"):
         changes = parse_git_diff(diff_content)
+        hunks = split_hunks(changes)
 
-        # Prepare the prompt for the AI
-        prompt = _build_explanation_prompt(changes, detailed)
-
-    try:
-        # Get AI explanation
-        client = get_ai_client()
-        response = client.generate(
-            prompt=prompt,
-            max_tokens=config.ai.max_tokens,
-            temperature=config.ai.temperature,
-        )
-
-        # Display the explanation
+    # Trivial changes don't need the model
+    summary = _try_local_summary(changes)
+    if summary is not None:
         console.print(
             Panel(
-                response,
+                Text(summary),
                 title="[bold green]✨ Changes Explained[/bold green]",
                 border_style="green",
             )
         )
+        return
+
+    try:
+        client = get_ai_client()
+        client.use_cache = use_cache
+
+        if len(hunks) > 1:
+            # Explain each file concurrently, then explain the summaries as a whole
+            summaries = asyncio.run(_explain_parallel(client, hunks))
+            prompt = _build_explanation_prompt(
+                "\n\n".join(summaries),
+                detailed,
+                language=config.user.language,
+                heading="Summaries of the changes per file",
+            )
+            chunks = client.generate(
+                prompt=prompt,
+                max_tokens=config.ai.max_tokens,
+                temperature=config.ai.temperature,
+                stream=True,
+            )
+        else:
+            prompt = _build_explanation_prompt(changes, detailed, language=config.user.language)
+            chunks = client.generate(
+                prompt=prompt,
+                max_tokens=config.ai.max_tokens,
+                temperature=config.ai.temperature,
+                payload=changes,
+                stream=True,
+            )
+
+        # Wait for the first chunk so the client's status is gone before going live
+        explanation = Text(next(chunks, ""))
+        panel = Panel(
+            explanation,
+            title="[bold green]✨ Changes Explained[/bold green]",
+            border_style="green",
+        )
+
+        # Display the explanation as it is generated
+        with Live(panel, console=console, vertical_overflow="visible"):
+            for chunk in chunks:
+                explanation.append(chunk)
     except Exception as e:
         console.print(f"[red]❌ Error explaining changes: {str(e)}[/red]")
 
 
-def _build_explanation_prompt(changes: str, detailed: bool = False, language: str = "en") -> str:
-    """Build an AI prompt for explaining Git diffs."""
+def _try_local_summary(changes: str) -> Optional[str]:
+    """Explain renames, whitespace and import-order changes locally.
+
+    Diffs shorter than the min_diff_chars setting are shown as is.
+
+    Returns:
+        The explanation, or None if the changes need the model
+    """
+    files = ", ".join(get_changed_files(changes))
+    renames = get_renamed_files(changes)
+
+    if renames:
+        return "\n".join(
+            f"Renamed {old} to {new} without changing its content." for old, new in renames
+        )
+    if is_whitespace_only(changes):
+        return f"Whitespace-only changes in {files}. The code itself is unchanged."
+    if is_import_reorder_only(changes):
+        return f"Reordered imports in {files}. No imports were added or removed."
+    if len(changes) < config.ai.min_diff_chars:
+        return changes
+    return None
+
+
+async def _explain_parallel(client: AIClient, hunks: List[str]) -> List[str]:
+    """Summarize each hunk concurrently, bounded by the max_concurrency setting."""
+    semaphore = asyncio.Semaphore(config.ai.max_concurrency)
+    completed = 0
+
+    async def summarize(index: int, hunk: str) -> str:
+        async with semaphore:
+            summary = await client.agenerate(
+                prompt=_build_hunk_prompt(hunk, language=config.user.language),
+                max_tokens=config.ai.max_tokens,
+                temperature=config.ai.temperature,
+            )
+        label = ", ".join(get_changed_files(hunk)) or f"#{index + 1}"
+        return f"File {label}:\n{summary.strip()}"
+
+    with Status(f"[bold yellow]🤖 Explaining 0/{len(hunks)} hunks...", spinner="dots") as status:
+
+        def on_done(_task: asyncio.Task) -> None:
+            nonlocal completed
+            completed += 1
+            status.update(f"[bold yellow]🤖 Explaining {completed}/{len(hunks)} hunks...")
+
+        tasks = [asyncio.create_task(summarize(i, hunk)) for i, hunk in enumerate(hunks)]
+        for task in tasks:
+            task.add_done_callback(on_done)
+
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            await client.aclose()
+
+
+def _build_hunk_prompt(hunk: str, language: str = "en") -> str:
+    """Build an AI prompt for summarizing the changes to a single file."""
+    instruction = _HUNK_INSTRUCTION
+    if not language.lower().startswith("en"):
+        instruction = f"Please respond in {language}.\n{instruction}"
+    return f"{instruction}\n\nGit diff:\n{hunk.strip()}"
+
+
+def _build_explanation_prompt(
+    changes: str, detailed: bool = False, language: str = "en", heading: str = "Git diff"
+) -> str:
+    """Build an AI prompt for explaining Git diffs.
+
+    The heading labels the changes, e.g. when they are per-file summaries
+    instead of the raw diff.
+    """
     # Language instruction for non-English responses
-    language_instruction = (
-        "" if language.lower().startswith("en") else f"Please respond in {language}."
-    )
-
-    # Core instruction for the AI
-    core_instruction = textwrap.dedent(f"""
-        {language_instruction}
-        You are an expert Git assistant. Analyze the following Git diff and explain the
-        changes in a clear, structured way that helps developers understand them quickly.
-
-        Your explanation should include:
-        1. **Summary**: A concise one- or two-sentence overview of the main purpose.
-        2. **Files Affected**: A list of key files or directories changed.
-        3. **Details**: For each change, describe:
-           - What was modified or added
-           - Why the change was made
-        4. **Impact & Risks**: Potential side effects, regressions, or areas to review.
-        5. **Best Practices / Patterns**: Any design patterns, conventions, or best practices used.
-    """)
+    core_instruction = _CORE_INSTRUCTION
+    if not language.lower().startswith("en"):
+        core_instruction = f"Please respond in {language}.\n{core_instruction}"
 
     # Detailed instructions, if requested
-    detailed_section = ""
-    if detailed:
-        detailed_section = textwrap.dedent("""
-            -- Detailed Analysis --
-            6. **Technical Specifics**: Explain complex logic, edge cases, and performance considerations.
-            7. **Dependencies & Affected Areas**: Note related modules or features that might be impacted.
-            8. **References**: Link to relevant documentation, code comments, or design docs if available.
-        """)
+    detailed_section = _DETAILED_INSTRUCTION if detailed else ""
 
     # Assemble final prompt
-    prompt = (
-        f"{core_instruction.strip()}\n{detailed_section.strip()}\n\nGit diff:\n{changes.strip()}"
-    )
-    return prompt
+    return "\n".join([core_instruction, detailed_section, f"\n{heading}:\n{changes.strip()}"])
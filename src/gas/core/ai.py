@@ -1,18 +1,30 @@
+import asyncio
+import functools
 import os
 import json
+import random
 import re
 import time
-from typing import Optional, Dict
+from typing import TYPE_CHECKING, Iterator, Optional, Dict, Tuple, Union
 
-from dotenv import load_dotenv
-from huggingface_hub import InferenceClient
-from rich.console import Console
 from rich.status import Status
 
+from gas.core.cache import DiskCache
 from gas.core.config import config
+from gas.core.console import console
+from gas.core.semantic_cache import SemanticCache
 
-load_dotenv()
-console = Console()
+if TYPE_CHECKING:
+    from huggingface_hub import AsyncInferenceClient
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the 'speedups' extra
+    orjson = None
+
+# Patterns used to find JSON in LLM output
+_JSON_FENCED = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_RAW = re.compile(r"\{.*\}", re.DOTALL)
 
 
 class AIClient:
@@ -23,62 +35,119 @@ class AIClient:
             api_key: HuggingFace API key. Defaults to HUGGINGFACE_API_KEY env var.
             max_retries: Maximum number of retries for API calls.
         """
+        # Imported here as huggingface_hub is slow to import and most commands don't need it
+        from huggingface_hub import InferenceClient
+
         self.api_key = api_key or _get_api_key()
         self.client = InferenceClient(
             provider="cohere",  # Using Cohere via HF Inference API
             api_key=self.api_key,
         )
+        self._async_client: Optional["AsyncInferenceClient"] = None
         self.max_retries = max_retries
+        self.cache = DiskCache(max_entries=config.ai.cache_max_entries)
+        self.semantic_cache = _get_semantic_cache()
+        self.use_cache = True
 
     def generate(
-        self, prompt: str, max_tokens: Optional[int] = None, temperature: Optional[float] = None
-    ) -> str:
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        payload: Optional[str] = None,
+        stream: bool = False,
+    ) -> Union[str, Iterator[str]]:
         """Generate text using the AI model with retry logic.
 
         Args:
             prompt: The input prompt for generation
             max_tokens: Maximum number of tokens to generate
             temperature: Temperature for generation (0.0 to 1.0)
+            payload: Varying part of the prompt (e.g. the diff) used for semantic
+                cache lookups. The semantic cache is skipped when not given.
+            stream: Whether to return an iterator over the response chunks as they
+                are generated. Cached responses are returned as a single chunk.
 
         Returns:
-            Generated text response
+            Generated text response, or an iterator over its chunks when streaming
 
         Raises:
             ValueError: If the API call fails after max retries
         """
+        chunks = self._generate_chunks(prompt, max_tokens, temperature, payload, stream)
+        return chunks if stream else "".join(chunks)
+
+    def _generate_chunks(
+        self,
+        prompt: str,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        payload: Optional[str],
+        stream: bool,
+    ) -> Iterator[str]:
+        """Yield the response chunks for a prompt, using the caches when possible."""
         last_error = None
+        completion = None
 
         # Use config values if not overridden
         max_tokens = max_tokens or config.ai.max_tokens
         temperature = temperature or config.ai.temperature
 
+        cache_key = DiskCache.make_key(
+            config.ai.model, temperature, max_tokens, config.user.language, prompt
+        )
+        if self.use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
         thinking_emoji = "🤖" if config.user.emoji_enabled else ""
         retry_emoji = "🔄" if config.user.emoji_enabled else ""
         error_emoji = "❌" if config.user.emoji_enabled else ""
+        search_emoji = "🔎" if config.user.emoji_enabled else ""
 
+        # The status must be closed before chunks are yielded, so callers can display them
         with Status(f"[bold yellow]{thinking_emoji} Thinking...", spinner="dots") as status:
-            for attempt in range(self.max_retries):
+            # Prompts sharing everything but the payload are compared semantically
+            semantic_scope = None
+            if self.semantic_cache and payload:
+                semantic_scope = DiskCache.make_key(
+                    config.ai.model,
+                    temperature,
+                    max_tokens,
+                    config.user.language,
+                    prompt.replace(payload, ""),
+                )
+
+            hit = None
+            if semantic_scope and self.use_cache:
+                status.update(f"[bold yellow]{search_emoji} Searching similar responses...")
+                hit = self._semantic_lookup(payload, semantic_scope)
+                if hit:
+                    status.update(f"[bold green]{search_emoji} Semantic cache hit")
+                else:
+                    status.update(f"[bold yellow]{thinking_emoji} Semantic cache miss, thinking...")
+
+            for attempt in range(0 if hit else self.max_retries):
                 try:
                     status.update(
                         f"[bold yellow]{thinking_emoji} Thinking... (Attempt {attempt + 1}/{self.max_retries})"
                     )
 
-                    # Add language preference to prompt if not English
-                    if config.user.language != "en":
-                        prompt = f"Please respond in {config.user.language} language.\n\n{prompt}"
-
                     completion = self.client.chat.completions.create(
                         model=config.ai.model,
                         messages=[{"role": "user", "content": prompt}],
                         temperature=temperature,
                         max_tokens=max_tokens,
+                        stream=stream,
                     )
-                    return completion.choices[0].message.content
+                    break
 
                 except Exception as e:
                     last_error = e
                     if attempt < self.max_retries - 1:
-                        wait_time = 1.5**attempt  # Exponential backoff
+                        wait_time = _backoff_delay(attempt)
                         status.update(
                             f"[yellow]{retry_emoji} Retrying... ({attempt + 1}/{self.max_retries}): {str(e)}"
                         )
@@ -87,27 +156,162 @@ class AIClient:
                         status.update(f"[red]{error_emoji} Failed to generate response")
                         console.print(f"[red]Max retries reached. Last error: {str(e)}[/red]")
 
+        if hit:
+            response, similarity = hit
+            console.print(
+                f"[dim]Reusing the response for a similar diff (similarity {similarity:.2f})[/dim]"
+            )
+            yield response
+            return
+
+        if completion is None:
+            raise ValueError(
+                f"Failed to generate response after {self.max_retries} attempts: {str(last_error)}"
+            )
+
+        if stream:
+            parts = []
+            for chunk in completion:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+            content = "".join(parts)
+        else:
+            content = completion.choices[0].message.content
+            yield content
+
+        self.cache.put(cache_key, content)
+        # The lookup disables the semantic cache if it fails
+        if semantic_scope and self.semantic_cache is not None:
+            self._semantic_store(payload, semantic_scope, content)
+
+    async def agenerate(
+        self, prompt: str, max_tokens: Optional[int] = None, temperature: Optional[float] = None
+    ) -> str:
+        """Generate text asynchronously, so several requests can run concurrently.
+
+        Unlike generate, no status is displayed and the semantic cache is not used.
+        Call aclose() once done, before the event loop ends.
+
+        Args:
+            prompt: The input prompt for generation
+            max_tokens: Maximum number of tokens to generate
+            temperature: Temperature for generation (0.0 to 1.0)
+
+        Returns:
+            Generated text response
+
+        Raises:
+            ValueError: If the API call fails after max retries
+        """
+        last_error = None
+
+        # Use config values if not overridden
+        max_tokens = max_tokens or config.ai.max_tokens
+        temperature = temperature or config.ai.temperature
+
+        cache_key = DiskCache.make_key(
+            config.ai.model, temperature, max_tokens, config.user.language, prompt
+        )
+        if self.use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if self._async_client is None:
+            from huggingface_hub import AsyncInferenceClient
+
+            self._async_client = AsyncInferenceClient(provider="cohere", api_key=self.api_key)
+
+        for attempt in range(self.max_retries):
+            try:
+                completion = await self._async_client.chat.completions.create(
+                    model=config.ai.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+                content = completion.choices[0].message.content
+                self.cache.put(cache_key, content)
+                return content
+
+            except Exception as e:
+                last_error = e
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(_backoff_delay(attempt))
+
         raise ValueError(
             f"Failed to generate response after {self.max_retries} attempts: {str(last_error)}"
         )
 
+    async def aclose(self) -> None:
+        """Close the session used by agenerate."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _semantic_lookup(self, payload: str, scope: str) -> Optional[Tuple[str, float]]:
+        """Look up a similar payload, disabling the semantic cache if it fails."""
+        try:
+            return self.semantic_cache.lookup(payload, scope)
+        except Exception as e:
+            console.print(f"[yellow]Semantic cache disabled: {str(e)}[/yellow]")
+            self.semantic_cache = None
+            return None
+
+    def _semantic_store(self, payload: str, scope: str, response: str) -> None:
+        """Store a response in the semantic cache, ignoring failures."""
+        try:
+            self.semantic_cache.add(payload, scope, response)
+        except Exception as e:
+            console.print(f"[yellow]Could not update semantic cache: {str(e)}[/yellow]")
+
     def _extract_json(self, text: str) -> Dict:
         """Extract JSON from potentially messy LLM output."""
         # Try to find JSON in code blocks
-        match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
+        match = _JSON_FENCED.search(text)
         if match:
-            return json.loads(match.group(1))
+            return _json_loads(match.group(1))
 
         # Try to find raw JSON
-        match = re.search(r"\{.*\}", text, re.DOTALL)
+        match = _JSON_RAW.search(text)
         if match:
-            return json.loads(match.group(0))
+            return _json_loads(match.group(0))
 
         raise ValueError("Could not extract valid JSON from response")
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Get the delay before retrying a failed request.
+
+    Exponential backoff capped at the retry_cap setting, with jitter so that
+    concurrent requests don't retry in lockstep.
+    """
+    return min(config.ai.retry_cap, 1.5**attempt) * (0.5 + random.random())
+
+
+def _json_loads(text: str) -> Dict:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+@functools.lru_cache(maxsize=1)
+def _init_env() -> None:
+    """Load environment variables from a .env file, once per process."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
 def _get_api_key() -> str:
-    """Get the Hugging Face API key from environment variables."""
+    """Get the Hugging Face API key from environment variables or a .env file."""
+    _init_env()
     api_key = os.getenv("HUGGINGFACE_API_KEY")
 
     if not api_key:
@@ -121,6 +325,25 @@ def _get_api_key() -> str:
     return api_key
 
 
+def _get_semantic_cache() -> Optional[SemanticCache]:
+    """Create the semantic cache if it is enabled and its dependencies are installed."""
+    if not config.ai.semantic_cache_enabled:
+        return None
+
+    if not SemanticCache.is_available():
+        console.print(
+            "[yellow]Semantic cache is enabled but its dependencies are missing. "
+            "Install them with: pip install 'gas[semantic]'[/yellow]"
+        )
+        return None
+
+    return SemanticCache(threshold=config.ai.semantic_threshold)
+
+
+@functools.lru_cache(maxsize=4)
 def get_ai_client(api_key: Optional[str] = None, max_retries: int = 3) -> AIClient:
-    """Get an instance of the AI client."""
+    """Get an instance of the AI client.
+
+    Clients are reused per (api_key, max_retries), so their HTTP sessions are shared.
+    """
     return AIClient(api_key=api_key, max_retries=max_retries)
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# Directory where cached AI responses are stored
+CACHE_DIR = Path.home() / ".cache" / "gas" / "responses"
+
+
+class DiskCache:
+    """Exact-match response cache stored as one JSON file per entry.
+
+    Entries are evicted least-recently-used first once ``max_entries`` is exceeded.
+    A hit refreshes the entry's modification time, which is used as the LRU clock.
+    """
+
+    def __init__(self, root: Path = CACHE_DIR, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            root: Directory holding the cache entries
+            max_entries: Maximum number of entries to keep (0 disables the cache)
+        """
+        self.root = root
+        self.max_entries = max_entries
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Build a cache key from the values that determine a response."""
+        raw = "|".join(str(part) for part in parts)
+        return hashlib.blake2b(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for a key, or None on a miss."""
+        if self.max_entries <= 0:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)["response"]
+            os.utime(path)  # Mark as recently used
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        """Store a value, evicting the least recently used entries if needed.
+
+        Write errors are ignored: the cache is only an optimization.
+        """
+        if self.max_entries <= 0:
+            return
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"response": value}, f)
+                # Atomic rename so readers never see a partially written entry
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._evict()
+        except OSError:
+            pass
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries above ``max_entries``."""
+        entries = []
+        for path in self.root.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
@@ -1,7 +1,8 @@
+import copy
+import functools
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import IO, ClassVar, Optional, Dict, Any, List, Tuple
 
-import yaml
 from pydantic import BaseModel, Field
 
 # Configuration paths in order of precedence (highest to lowest)
@@ -21,6 +22,36 @@ class AIConfig(BaseModel):
         default=0.7, ge=0.0, le=1.0, description="Temperature for generation (0.0 to 1.0)"
     )
     max_tokens: int = Field(default=500, gt=0, description="Maximum number of tokens to generate")
+    max_diff_chars: int = Field(
+        default=100_000, ge=0, description="Maximum diff size sent to the model (0 for no limit)"
+    )
+    min_diff_chars: int = Field(
+        default=0,
+        ge=0,
+        description="Diffs shorter than this are shown as is, without the model (0 disables)",
+    )
+    max_concurrency: int = Field(
+        default=4, gt=0, description="Maximum number of concurrent requests when explaining diffs"
+    )
+    retry_cap: float = Field(
+        default=10.0, gt=0, description="Maximum delay in seconds between retries"
+    )
+    cache_max_entries: int = Field(
+        default=256, ge=0, description="Maximum number of cached AI responses (0 disables caching)"
+    )
+    hunk_cache_enabled: bool = Field(
+        default=False,
+        description="Whether to describe multi-file commits per file, reusing cached descriptions",
+    )
+    semantic_cache_enabled: bool = Field(
+        default=False, description="Whether to reuse responses for similar diffs"
+    )
+    semantic_threshold: float = Field(
+        default=0.93,
+        ge=0.0,
+        le=1.0,
+        description="Minimum similarity (0.0 to 1.0) for reusing a response for a similar diff",
+    )
 
 
 class UserConfig(BaseModel):
@@ -36,6 +67,9 @@ class Config(BaseModel):
     ai: AIConfig = Field(default_factory=AIConfig)
     user: UserConfig = Field(default_factory=UserConfig)
 
+    # Parsed config files keyed by path, with the (mtime_ns, size) they were parsed at
+    _file_cache: ClassVar[Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]]] = {}
+
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from all sources and merge them.
@@ -56,13 +90,27 @@ class Config(BaseModel):
 
         return cls.model_validate(config_dict or {})
 
-    @staticmethod
-    def _load_file(path: Path) -> Optional[Dict[str, Any]]:
-        """Load a single configuration file."""
-        if path.exists():
-            with open(path, "r") as f:
-                return yaml.safe_load(f) or {}
-        return None
+    @classmethod
+    def _load_file(cls, path: Path) -> Optional[Dict[str, Any]]:
+        """Load a single configuration file.
+
+        Parsed files are cached until their modification time or size changes.
+        The returned dictionary is shared and must not be modified.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = cls._file_cache.get(path)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        with open(path, "r") as f:
+            data = _load_yaml(f) or {}
+        cls._file_cache[path] = (version, data)
+        return data
 
     def save(self, scope: str = "local") -> None:
         """Save configuration to file.
@@ -82,7 +130,7 @@ class Config(BaseModel):
 
         # Save config
         with open(config_path, "w") as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False)
+            _dump_yaml(self.model_dump(), f)
 
     def set_value(self, key_path: str, value: Any, scope: str = "local") -> None:
         """Set a configuration value by its dot-notation path.
@@ -95,23 +143,15 @@ class Config(BaseModel):
         # Split the path into parts
         parts = key_path.split(".")
 
-        # Validate the path exists in our schema
-        current = self.model_dump()
-        for part in parts[:-1]:
-            if part not in current:
-                raise ValueError(f"Invalid config path: {key_path}")
-            current = current[part]
-
-        if parts[-1] not in current:
+        # Validate the path and the new value against the affected section only
+        try:
+            updated = _replace_value(self, parts, value)
+        except KeyError:
             raise ValueError(f"Invalid config path: {key_path}")
 
         # Load existing config for the specified scope
         config_path = CONFIG_PATHS[scope]
-        if config_path.exists():
-            with open(config_path, "r") as f:
-                config_dict = yaml.safe_load(f) or {}
-        else:
-            config_dict = {}
+        config_dict = copy.deepcopy(self._load_file(config_path) or {})
 
         # Update the value
         current = config_dict
@@ -124,11 +164,18 @@ class Config(BaseModel):
         # Save the updated config
         config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(config_path, "w") as f:
-            yaml.dump(config_dict, f, default_flow_style=False)
+            _dump_yaml(config_dict, f)
+
+        # Cache the written contents, so an earlier parse with the same mtime and size
+        # (possible with coarse timestamps) is never reused
+        stat = config_path.stat()
+        Config._file_cache[config_path] = ((stat.st_mtime_ns, stat.st_size), config_dict)
 
-        # Reload the configuration
-        global config
-        config = Config.load()
+        # Update this instance, unless the local config still overrides a global change.
+        # Like load(), a local section replaces the whole global section.
+        if scope == "global" and parts[0] in (self._load_file(CONFIG_PATHS["local"]) or {}):
+            return
+        setattr(self, parts[0], getattr(updated, parts[0]))
 
     def get_value(self, key_path: str) -> Any:
         """Get a configuration value by its dot-notation path."""
@@ -140,8 +187,15 @@ class Config(BaseModel):
         return current
 
     @classmethod
-    def list_options(cls) -> List[Dict[str, str]]:
-        """List all available configuration options with their descriptions."""
+    @functools.lru_cache(maxsize=1)
+    def list_options(cls) -> List[Dict[str, Any]]:
+        """List all available configuration options with their descriptions.
+
+        Each option also carries its path split into keys, for walking nested dicts.
+
+        The schema is static, so the options are only computed once.
+        The returned list is shared and must not be modified.
+        """
         options = []
 
         def extract_fields(model_class: type[BaseModel], prefix: str = ""):
@@ -164,6 +218,7 @@ class Config(BaseModel):
                     options.append(
                         {
                             "path": full_path,
+                            "keys": tuple(full_path.split(".")),
                             "description": field.description or "",
                             "default": str(default_value),
                         }
@@ -174,5 +229,51 @@ class Config(BaseModel):
         return options
 
 
+def _load_yaml(stream: IO[str]) -> Any:
+    """Parse YAML, importing PyYAML only when a config file actually exists.
+
+    The libyaml C bindings are used when available, they are much faster than pure Python.
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _dump_yaml(data: Dict[str, Any], stream: IO[str]) -> None:
+    """Write YAML, using the libyaml C bindings when available."""
+    import yaml
+
+    yaml.dump(
+        data,
+        stream,
+        default_flow_style=False,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+
+def _replace_value(model: BaseModel, parts: List[str], value: Any) -> BaseModel:
+    """Return a copy of a model with a nested value replaced.
+
+    Only the model directly containing the value is revalidated.
+
+    Raises:
+        KeyError: If the path does not point to a setting
+        ValueError: If the value is invalid for the setting
+    """
+    name = parts[0]
+    if name not in type(model).model_fields:
+        raise KeyError(name)
+
+    child = getattr(model, name)
+    if len(parts) == 1:
+        if isinstance(child, BaseModel):
+            raise KeyError(name)
+        return type(model).model_validate({**model.model_dump(), name: value})
+
+    if not isinstance(child, BaseModel):
+        raise KeyError(name)
+    return model.model_copy(update={name: _replace_value(child, parts[1:], value)})
+
+
 # Global configuration instance
 config = Config.load()
@@ -0,0 +1,5 @@
+from rich import get_console
+
+# Shared console for all gas output. This is rich's global console, which is also
+# the default for Status, Live and Confirm, so terminal detection only runs once.
+console = get_console()
@@ -0,0 +1,52 @@
+from pathlib import Path
+from typing import List, Optional
+
+from gas.core.cache import DiskCache
+
+# Directory where per-hunk fragments are stored
+CACHE_DIR = Path.home() / ".cache" / "gas" / "templates"
+
+
+class GenCache:
+    """Template-aware cache of generated fragments.
+
+    Prompts built from the same skeleton share a template id. For each template,
+    the cache maps individual diff hunks to the fragment previously generated for
+    them, and a set of hunks to the summary written for that set. A request only
+    needs to send the hunks without a cached fragment to the model.
+    """
+
+    def __init__(self, root: Path = CACHE_DIR, max_entries: int = 256):
+        """Initialize the cache.
+
+        Args:
+            root: Directory holding the cache entries
+            max_entries: Maximum number of fragments and summaries to keep
+        """
+        self.store = DiskCache(root=root, max_entries=max_entries)
+
+    @staticmethod
+    def template_id(skeleton: str, *params: object) -> str:
+        """Identify a prompt skeleton together with the parameters it is used with."""
+        return DiskCache.make_key("template", skeleton, *params)
+
+    def get_fragment(self, template_id: str, hunk: str) -> Optional[str]:
+        """Return the cached fragment for a hunk, or None on a miss."""
+        return self.store.get(DiskCache.make_key(template_id, "hunk", hunk))
+
+    def put_fragment(self, template_id: str, hunk: str, fragment: str) -> None:
+        """Store the fragment generated for a hunk."""
+        self.store.put(DiskCache.make_key(template_id, "hunk", hunk), fragment)
+
+    def get_summary(self, template_id: str, hunks: List[str]) -> Optional[str]:
+        """Return the cached summary for a set of hunks, or None on a miss."""
+        return self.store.get(self._summary_key(template_id, hunks))
+
+    def put_summary(self, template_id: str, hunks: List[str], summary: str) -> None:
+        """Store the summary generated for a set of hunks."""
+        self.store.put(self._summary_key(template_id, hunks), summary)
+
+    @staticmethod
+    def _summary_key(template_id: str, hunks: List[str]) -> str:
+        hunk_keys = sorted(DiskCache.make_key(hunk) for hunk in hunks)
+        return DiskCache.make_key(template_id, "summary", *hunk_keys)
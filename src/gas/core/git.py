@@ -1,5 +1,24 @@
+import functools
+import os
+import re
 import subprocess
-from typing import Optional
+from collections import Counter
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pygit2
+
+# Splits a diff before every file header, keeping the header with its hunk
+_HUNK_SPLIT = re.compile(r"(?m)^(?=diff --git )")
+
+# Per-file diff header fields
+_FILE_HEADER = re.compile(r"(?m)^diff --git a/.+ b/(.+)$")
+_RENAME_FROM = re.compile(r"(?m)^rename from (.+)$")
+_RENAME_TO = re.compile(r"(?m)^rename to (.+)$")
+_IMPORT_LINE = re.compile(r"^\s*(?:import|from)\s")
+
+# Appended to diffs cut at the max_diff_chars setting
+_TRUNCATED_NOTE = "\n[diff truncated]\n"
 
 
 def parse_git_diff(diff_content: str) -> str:
@@ -16,23 +35,106 @@ def parse_git_diff(diff_content: str) -> str:
     return diff_content.strip()
 
 
-def get_staged_changes() -> Optional[str]:
+def split_hunks(diff_content: str) -> List[str]:
+    """Split a git diff into one chunk per changed file.
+
+    Args:
+        diff_content: Raw git diff content
+
+    Returns:
+        List of per-file diffs, each starting with its ``diff --git`` header
+    """
+    return [hunk.strip() for hunk in _HUNK_SPLIT.split(diff_content) if hunk.strip()]
+
+
+def get_changed_files(diff_content: str) -> List[str]:
+    """Get the paths of the files changed in a git diff (new paths for renames)."""
+    return _FILE_HEADER.findall(diff_content)
+
+
+def get_renamed_files(diff_content: str) -> List[Tuple[str, str]]:
+    """Get the (old, new) paths if the diff only contains pure renames.
+
+    Returns:
+        The renamed paths, or an empty list if any file has other changes
+    """
+    renames = []
+    for hunk in split_hunks(diff_content):
+        old, new = _RENAME_FROM.search(hunk), _RENAME_TO.search(hunk)
+        if not (old and new and "\nsimilarity index 100%" in hunk):
+            return []
+        renames.append((old.group(1), new.group(1)))
+    return renames
+
+
+def is_whitespace_only(diff_content: str) -> bool:
+    """Check whether a diff only changes trailing whitespace or line endings.
+
+    Within each hunk, every run of removed lines must be directly followed by the
+    same number of added lines, and each removed line must differ from the added
+    line next to it only in trailing whitespace. Identical pairs are moves.
+    """
+    hunks = split_hunks(diff_content)
+    if not hunks:
+        return False
+
+    for hunk in hunks:
+        blocks = _change_blocks(hunk)
+        if not blocks:
+            return False
+        for removed, added in blocks:
+            if len(removed) != len(added):
+                return False
+            for old, new in zip(removed, added):
+                if old == new or old.rstrip() != new.rstrip():
+                    return False
+    return True
+
+
+def is_import_reorder_only(diff_content: str) -> bool:
+    """Check whether a diff only reorders import statements within each file."""
+    hunks = split_hunks(diff_content)
+    if not hunks:
+        return False
+
+    for hunk in hunks:
+        removed, added = _changed_lines(hunk)
+        if not removed or not all(_IMPORT_LINE.match(line) for line in removed + added):
+            return False
+        if Counter(line.rstrip() for line in removed) != Counter(line.rstrip() for line in added):
+            return False
+    return True
+
+
+def get_staged_changes(max_chars: int = 0) -> Optional[str]:
     """Get the staged changes in the repository.
 
+    Args:
+        max_chars: Maximum number of characters to read (0 for no limit)
+
     Returns:
         String containing the staged changes or None if no changes
     """
+    repo = _open_repository()
+    if repo is not None and not repo.head_is_unborn:
+        diff = repo.index.diff_to_tree(repo.head.peel(_import_pygit2().Tree))
+        diff.find_similar()  # Detect renames like git diff does
+        return truncate_diff(diff.patch or "", max_chars).strip()
+
     try:
-        result = subprocess.run(
-            ["git", "diff", "--cached"], capture_output=True, text=True, check=True
-        )
-        return result.stdout.strip()
+        return _read_git_output(
+            ["git", "diff", "--cached"], max_chars, stderr=subprocess.DEVNULL
+        ).strip()
     except subprocess.CalledProcessError:
         return None
 
 
 def get_current_branch() -> str:
     """Get the name of the current branch."""
+    repo = _open_repository()
+    if repo is not None and not repo.head_is_unborn:
+        return "" if repo.head_is_detached else repo.head.shorthand
+
     try:
         result = subprocess.run(
             ["git", "branch", "--show-current"], capture_output=True, text=True, check=True
@@ -44,6 +146,9 @@ def get_current_branch() -> str:
 
 def is_git_repository() -> bool:
     """Check if the current directory is a git repository."""
+    if _import_pygit2() is not None:
+        return _open_repository() is not None
+
     try:
         subprocess.run(
             ["git", "rev-parse", "--is-inside-work-tree"], capture_output=True, check=True
@@ -53,6 +158,130 @@ def is_git_repository() -> bool:
         return False
 
 
-def get_git_diff() -> str:
-    """Get the git diff for the current branch."""
-    return subprocess.check_output(["git", "diff"]).decode("utf-8")
+def get_git_diff(max_chars: int = 0) -> str:
+    """Get the git diff for the current branch.
+
+    Args:
+        max_chars: Maximum number of characters to read (0 for no limit)
+    """
+    repo = _open_repository()
+    if repo is not None:
+        return truncate_diff(repo.diff().patch or "", max_chars)
+
+    return _read_git_output(["git", "diff"], max_chars)
+
+
+def truncate_diff(diff_content: str, max_chars: int) -> str:
+    """Truncate a diff to at most ``max_chars`` characters, at a line boundary.
+
+    Args:
+        diff_content: Raw git diff content
+        max_chars: Maximum number of characters to keep (0 for no limit)
+
+    Returns:
+        The diff, followed by a note if it was truncated
+    """
+    if not max_chars or len(diff_content) <= max_chars:
+        return diff_content
+
+    cut = diff_content.rfind("\n", 0, max_chars) + 1 or max_chars
+    return f"{diff_content[:cut]}{_TRUNCATED_NOTE}"
+
+
+def _read_git_output(args: List[str], max_chars: int, stderr: Optional[int] = None) -> str:
+    """Run a git command, reading at most ``max_chars`` characters of its output.
+
+    The process is stopped once the limit is reached, so huge diffs are never
+    fully produced or buffered.
+
+    Raises:
+        subprocess.CalledProcessError: If the command fails
+    """
+    with subprocess.Popen(
+        args, stdout=subprocess.PIPE, stderr=stderr, encoding="utf-8", errors="replace"
+    ) as proc:
+        output = proc.stdout.read(max_chars + 1) if max_chars else proc.stdout.read()
+        truncated = bool(max_chars) and len(output) > max_chars
+        if truncated:
+            proc.kill()
+
+    if not truncated and proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, args, output)
+
+    return truncate_diff(output, max_chars)
+
+
+def _change_blocks(diff_content: str) -> List[Tuple[List[str], List[str]]]:
+    """Get the runs of removed lines and the added lines directly following them.
+
+    Lines are split on newlines only, so carriage returns are kept.
+    """
+    blocks: List[Tuple[List[str], List[str]]] = []
+    current: Optional[Tuple[List[str], List[str]]] = None
+    in_hunk = False
+    for line in diff_content.split("\n"):
+        if line.startswith("\\"):  # "\ No newline at end of file"
+            continue
+        if in_hunk and line.startswith("-"):
+            if current is None or current[1]:
+                current = ([], [])
+                blocks.append(current)
+            current[0].append(line[1:])
+        elif in_hunk and line.startswith("+"):
+            if current is None:
+                current = ([], [])
+                blocks.append(current)
+            current[1].append(line[1:])
+        else:
+            current = None  # Context lines and headers end a block
+            if line.startswith("diff --git "):
+                in_hunk = False
+            elif line.startswith("@@"):
+                in_hunk = True
+    return blocks
+
+
+def _changed_lines(diff_content: str) -> Tuple[List[str], List[str]]:
+    """Get the removed and added lines of a diff, without their +/- markers."""
+    removed, added = [], []
+    in_hunk = False
+    for line in diff_content.splitlines():
+        if line.startswith("diff --git "):
+            in_hunk = False  # File headers (including ---/+++ lines) until the next @@
+        elif line.startswith("@@"):
+            in_hunk = True
+        elif in_hunk and line.startswith("-"):
+            removed.append(line[1:])
+        elif in_hunk and line.startswith("+"):
+            added.append(line[1:])
+    return removed, added
+
+
+def _open_repository() -> Optional["pygit2.Repository"]:
+    """Open the repository containing the current directory in-process.
+
+    Returns:
+        The repository, or None if pygit2 is not installed or there is no repository
+    """
+    pygit2 = _import_pygit2()
+    if pygit2 is None:
+        return None
+
+    try:
+        path = pygit2.discover_repository(os.getcwd())
+        return pygit2.Repository(path) if path else None
+    except pygit2.GitError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _import_pygit2():
+    """Import pygit2 on first use, or return None if it is not installed.
+
+    pygit2 is an optional speedup, see the 'speedups' extra.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
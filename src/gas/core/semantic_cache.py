@@ -0,0 +1,140 @@
+import importlib.util
+import sqlite3
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Files backing the semantic cache
+CACHE_DIR = Path.home() / ".cache" / "gas"
+INDEX_PATH = CACHE_DIR / "sem.index"
+DB_PATH = CACHE_DIR / "sem.sqlite"
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Payloads are embedded in chunks so long diffs are not truncated to the model's
+# maximum sequence length; the chunk embeddings are averaged.
+_CHUNK_CHARS = 1000
+# Number of nearest neighbours inspected when looking for an entry in the same scope
+_SEARCH_K = 8
+
+
+class SemanticCache:
+    """Similarity cache returning a stored response for near-duplicate payloads.
+
+    Payloads (e.g. the diff being explained) are embedded with a sentence-transformers
+    model and searched in a FAISS inner-product index. A hit additionally requires
+    the same scope, i.e. the same model, generation settings and prompt skeleton.
+
+    Requires the optional ``semantic`` extra (sentence-transformers and faiss-cpu).
+    """
+
+    def __init__(
+        self, threshold: float = 0.93, index_path: Path = INDEX_PATH, db_path: Path = DB_PATH
+    ):
+        """Initialize the cache. The model and index are loaded on first use.
+
+        Args:
+            threshold: Minimum cosine similarity for a cached response to be reused
+            index_path: Path of the persisted FAISS index
+            db_path: Path of the SQLite file holding prompts and responses
+        """
+        self.threshold = threshold
+        self.index_path = index_path
+        self.db_path = db_path
+        self._model = None
+        self._index = None
+        self._db = None
+        self._last_embedding: Optional[Tuple[str, object]] = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether the optional semantic cache dependencies are installed."""
+        return all(
+            importlib.util.find_spec(name) is not None
+            for name in ("sentence_transformers", "faiss", "numpy")
+        )
+
+    def lookup(self, payload: str, scope: str) -> Optional[Tuple[str, float]]:
+        """Find a cached response for a similar payload.
+
+        Args:
+            payload: The varying part of the prompt to compare
+            scope: Key that must match exactly (model, settings, prompt skeleton)
+
+        Returns:
+            Tuple of (response, similarity) on a hit, None otherwise
+        """
+        self._load()
+        if self._index.ntotal == 0:
+            return None
+
+        scores, ids = self._index.search(self._embed(payload), min(_SEARCH_K, self._index.ntotal))
+        for score, entry_id in zip(scores[0], ids[0]):
+            if entry_id < 0 or score < self.threshold:
+                break
+            row = self._db.execute(
+                "SELECT response FROM entries WHERE id = ? AND scope = ?",
+                (int(entry_id), scope),
+            ).fetchone()
+            if row:
+                return row[0], float(score)
+
+        return None
+
+    def add(self, payload: str, scope: str, response: str) -> None:
+        """Store a response for a payload."""
+        import faiss
+
+        self._load()
+        entry_id = self._index.ntotal
+        self._index.add(self._embed(payload))
+        with self._db:
+            self._db.execute(
+                "INSERT INTO entries (id, scope, prompt, response) VALUES (?, ?, ?, ?)",
+                (entry_id, scope, payload, response),
+            )
+        faiss.write_index(self._index, str(self.index_path))
+
+    def _load(self) -> None:
+        """Load the embedding model, the index and the database."""
+        if self._index is not None:
+            return
+
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(EMBEDDING_MODEL, device="cpu")
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.db_path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(id INTEGER PRIMARY KEY, scope TEXT, prompt TEXT, response TEXT)"
+        )
+
+        dimension = self._model.get_sentence_embedding_dimension()
+        if self.index_path.exists():
+            self._index = faiss.read_index(str(self.index_path))
+        else:
+            self._index = faiss.IndexFlatIP(dimension)
+
+        # Index positions double as row ids, so start over if the two got out of sync
+        (count,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        if count != self._index.ntotal or self._index.d != dimension:
+            self._index = faiss.IndexFlatIP(dimension)
+            with self._db:
+                self._db.execute("DELETE FROM entries")
+
+    def _embed(self, payload: str):
+        """Embed a payload as a normalized float32 row vector."""
+        import numpy as np
+
+        if self._last_embedding and self._last_embedding[0] == payload:
+            return self._last_embedding[1]
+
+        chunks = [payload[i : i + _CHUNK_CHARS] for i in range(0, len(payload), _CHUNK_CHARS)]
+        vectors = self._model.encode(chunks or [""], normalize_embeddings=True)
+        vector = vectors.mean(axis=0, keepdims=True).astype(np.float32)
+        vector /= max(float(np.linalg.norm(vector)), 1e-12)
+
+        self._last_embedding = (payload, vector)
+        return vector
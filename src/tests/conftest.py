@@ -1,24 +1,62 @@
+import asyncio
+import os
 from pathlib import Path
-from typing import Iterator
+from types import SimpleNamespace
+from typing import Any
 import pytest
-import tempfile
+import yaml
+from gas.core.ai import AIClient
+from gas.core.cache import DiskCache
 from gas.core.config import Config
 
+# Use the libyaml bindings when available, like the config module does
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Keep temporary files (including the mocked config files) in memory when possible
+_SHM_DIR = "/dev/shm"
+
+
+def pytest_configure(config) -> None:
+    """Point pytest's temporary directories at tmpfs before any are created."""
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", _SHM_DIR)
+
+
+def load_yaml(stream) -> Any:
+    """Parse YAML from a string, bytes or file object."""
+    return yaml.load(stream, Loader=_Loader)
 
-@pytest.fixture
-def temp_config_dir() -> Iterator[Path]:
-    """Create a temporary directory for config files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+
+def dump_yaml(data: Any, stream=None):
+    """Serialize data as YAML, to a stream if given or as a string otherwise."""
+    return yaml.dump(data, stream, Dumper=_Dumper)
+
+
+@pytest.fixture(scope="session")
+def temp_config_dir(tmp_path_factory) -> Path:
+    """Create a temporary directory for config files, shared by the session.
+
+    tmp_path_factory gives each xdist worker its own base directory, so config
+    tests can run in parallel without sharing files.
+    """
+    return tmp_path_factory.mktemp("config")
 
 
 @pytest.fixture
 def mock_config_paths(temp_config_dir: Path, monkeypatch) -> dict[str, Path]:
-    """Override config paths to use temporary directory."""
+    """Override config paths to use temporary directory (on tmpfs if available)."""
     test_paths = {
         "local": temp_config_dir / ".gas.yaml",
         "global": temp_config_dir / "config.yml",
     }
+
+    # Start every test without config files
+    for path in test_paths.values():
+        path.unlink(missing_ok=True)
+    Config._file_cache.clear()
+
     monkeypatch.setattr("gas.core.config.CONFIG_PATHS", test_paths)
 
     # Reset the global config instance with mocked paths
@@ -44,3 +82,61 @@ index abc123..def456 100644
 +    # Add better implementation
 +    new_function()
 """
+
+
+class StubInferenceClient:
+    """Stand-in for huggingface_hub's InferenceClient that records the prompts it gets.
+
+    Responses come from ``respond``, which tests can replace.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.prompts: list[str] = []
+        self.respond = lambda prompt: f"response {len(self.prompts)}"
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, model, messages, temperature, max_tokens, stream=False):
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        content = self.respond(prompt)
+        if stream:
+            delta = SimpleNamespace(content=content)
+            return iter([SimpleNamespace(choices=[SimpleNamespace(delta=delta)])])
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class StubAsyncInferenceClient(StubInferenceClient):
+    """Stand-in for huggingface_hub's AsyncInferenceClient.
+
+    Tracks the highest number of requests in flight at once in ``max_active``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.active = 0
+        self.max_active = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._acreate))
+
+    async def _acreate(self, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0)  # Let the other requests start
+            return self._create(**kwargs)
+        finally:
+            self.active -= 1
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def ai_client(tmp_path: Path, monkeypatch) -> AIClient:
+    """Return an AI client backed by stub inference clients and a temporary cache."""
+    monkeypatch.setattr("huggingface_hub.InferenceClient", StubInferenceClient)
+    monkeypatch.setattr("huggingface_hub.AsyncInferenceClient", StubAsyncInferenceClient)
+
+    client = AIClient(api_key="test")
+    client.cache = DiskCache(root=tmp_path / "responses")
+    return client
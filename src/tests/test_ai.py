@@ -0,0 +1,39 @@
+class FailingSemanticCache:
+    """Semantic cache whose lookups always fail."""
+
+    def lookup(self, payload, scope):
+        raise RuntimeError("index is corrupt")
+
+    def add(self, payload, scope, response):
+        raise AssertionError("add() called on a disabled semantic cache")
+
+
+def test_generate_uses_cache(ai_client):
+    """Test that cached responses are returned without calling the model."""
+    stub = ai_client.client
+
+    assert ai_client.generate("prompt") == "response 1"
+    assert ai_client.generate("prompt") == "response 1"
+    assert list(ai_client.generate("prompt", stream=True)) == ["response 1"]
+    assert stub.prompts == ["prompt"]
+
+    # --no-cache skips the lookup and stores the fresh response
+    ai_client.use_cache = False
+    assert ai_client.generate("prompt") == "response 2"
+    assert len(stub.prompts) == 2
+
+    ai_client.use_cache = True
+    assert ai_client.generate("prompt") == "response 2"
+    assert len(stub.prompts) == 2
+
+
+def test_generate_disables_failing_semantic_cache(ai_client, capsys):
+    """Test that a failed semantic lookup disables the cache without breaking generation."""
+    ai_client.semantic_cache = FailingSemanticCache()
+
+    assert ai_client.generate("Explain:\ndiff", payload="diff") == "response 1"
+    assert ai_client.semantic_cache is None
+
+    output = capsys.readouterr().out
+    assert "Semantic cache disabled" in output
+    assert "Could not update semantic cache" not in output
@@ -0,0 +1,67 @@
+import os
+
+from gas.core.cache import DiskCache
+from gas.core.gencache import GenCache
+
+
+def test_cache_roundtrip(tmp_path):
+    """Test storing and retrieving a cached response."""
+    cache = DiskCache(root=tmp_path)
+    key = DiskCache.make_key("model", 0.7, 500, "en", "prompt")
+
+    assert cache.get(key) is None
+    cache.put(key, "response")
+    assert cache.get(key) == "response"
+
+
+def test_cache_key_depends_on_all_parts():
+    """Test that every generation parameter is part of the key."""
+    key = DiskCache.make_key("model", 0.7, 500, "en", "prompt")
+    assert key == DiskCache.make_key("model", 0.7, 500, "en", "prompt")
+    assert key != DiskCache.make_key("model", 0.3, 500, "en", "prompt")
+    assert key != DiskCache.make_key("model", 0.7, 500, "es", "prompt")
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test that the least recently used entry is evicted first."""
+    cache = DiskCache(root=tmp_path, max_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+
+    # Make "a" the most recently used entry
+    os.utime(tmp_path / "b.json", ns=(0, 0))
+    assert cache.get("a") == "1"
+
+    cache.put("c", "3")
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+def test_cache_disabled(tmp_path):
+    """Test that max_entries=0 disables the cache."""
+    cache = DiskCache(root=tmp_path, max_entries=0)
+    cache.put("a", "1")
+    assert cache.get("a") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_gencache_fragments_are_per_template(tmp_path):
+    """Test that fragments are only reused for the same template."""
+    cache = GenCache(root=tmp_path)
+    template_id = cache.template_id("skeleton", "model")
+    other_id = cache.template_id("other skeleton", "model")
+
+    cache.put_fragment(template_id, "hunk", "Describe hunk")
+    assert cache.get_fragment(template_id, "hunk") == "Describe hunk"
+    assert cache.get_fragment(other_id, "hunk") is None
+
+
+def test_gencache_summary_ignores_hunk_order(tmp_path):
+    """Test that summaries are keyed by the set of hunks."""
+    cache = GenCache(root=tmp_path)
+    template_id = cache.template_id("skeleton")
+
+    cache.put_summary(template_id, ["a", "b"], "Summary")
+    assert cache.get_summary(template_id, ["b", "a"]) == "Summary"
+    assert cache.get_summary(template_id, ["a"]) is None
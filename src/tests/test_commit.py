@@ -0,0 +1,46 @@
+import functools
+
+from gas.commands.commit import (
+    _build_commit_prompt,
+    _build_commit_template,
+    _generate_message,
+    _generate_message_by_hunk,
+)
+from gas.core.gencache import GenCache
+from gas.core.git import split_hunks
+
+
+def test_generate_message(ai_client, sample_diff, monkeypatch):
+    """Test that commit messages are generated from the commit prompt."""
+    monkeypatch.setattr("gas.commands.commit.get_ai_client", lambda: ai_client)
+    changes = sample_diff + sample_diff.replace("src/main.py", "src/other.py")
+
+    assert "".join(_generate_message(changes, commit_type="feat")) == "response 1"
+    assert ai_client.client.prompts == [_build_commit_prompt(changes, commit_type="feat")]
+
+
+def test_generate_message_by_hunk(ai_client, sample_diff, tmp_path, monkeypatch):
+    """Test that only hunks without a cached description are sent to the model."""
+    monkeypatch.setattr(
+        "gas.commands.commit.GenCache", functools.partial(GenCache, root=tmp_path / "templates")
+    )
+    main, other = split_hunks(sample_diff + sample_diff.replace("src/main.py", "src/other.py"))
+    template = _build_commit_template()
+    stub = ai_client.client
+
+    stub.respond = lambda prompt: '{"summary": "Update main", "changes": {"1": "Describe main"}}'
+    message = _generate_message_by_hunk(ai_client, template, [main])
+    assert message == "Update main\n\n- Describe main"
+
+    # The description of the first file is reused
+    stub.respond = lambda prompt: '{"summary": "Update both", "changes": {"2": "Describe other"}}'
+    message = _generate_message_by_hunk(ai_client, template, [main, other])
+    assert message == "Update both\n\n- Describe main\n- Describe other"
+    assert len(stub.prompts) == 2
+    assert other in stub.prompts[1]
+    assert main not in stub.prompts[1]
+    assert "- Describe main" in stub.prompts[1]
+
+    # Fully cached changes don't need the model
+    assert _generate_message_by_hunk(ai_client, template, [main, other]) == message
+    assert len(stub.prompts) == 2
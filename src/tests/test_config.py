@@ -1,12 +1,29 @@
+import os
+from pathlib import Path
+
 import pytest
-import yaml
 
+from conftest import load_yaml
 from gas.core.config import Config, AIConfig, UserConfig
 
 
-def test_default_config():
+@pytest.fixture(scope="module")
+def default_config() -> Config:
+    """Return a default configuration shared by the module. Must not be modified."""
+    return Config()
+
+
+def _write_configs(paths: dict[str, Path], global_yaml: str, local_yaml: str) -> None:
+    """Write the global and local config files."""
+    for scope, data in (("global", global_yaml), ("local", local_yaml)):
+        path = paths[scope]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data.encode())
+
+
+def test_default_config(default_config):
     """Test default configuration values."""
-    config = Config()
+    config = default_config
     assert isinstance(config.ai, AIConfig)
     assert isinstance(config.user, UserConfig)
     assert config.ai.model == "CohereLabs/c4ai-command-a-03-2025"
@@ -16,25 +33,19 @@ def test_default_config():
     assert config.user.emoji_enabled is True
 
 
-def test_config_load_empty(mock_config_paths):
+def test_config_load_empty(mock_config_paths, default_config):
     """Test loading configuration when no files exist."""
     config = Config.load()
-    assert config.user.language == "en"  # Default value
-    assert config.ai.model == "CohereLabs/c4ai-command-a-03-2025"  # Default value
+    assert config == default_config
 
 
 def test_config_local_override(mock_config_paths):
     """Test that local config overrides global config."""
-    # Create global config
-    global_config = {"user": {"language": "es"}, "ai": {"temperature": 0.5}}
-    mock_config_paths["global"].parent.mkdir(parents=True, exist_ok=True)
-    with open(mock_config_paths["global"], "w") as f:
-        yaml.dump(global_config, f)
-
-    # Create local config
-    local_config = {"user": {"language": "fr"}}
-    with open(mock_config_paths["local"], "w") as f:
-        yaml.dump(local_config, f)
+    _write_configs(
+        mock_config_paths,
+        global_yaml="user:\n  language: es\nai:\n  temperature: 0.5\n",
+        local_yaml="user:\n  language: fr\n",
+    )
 
     config = Config.load()
     assert config.user.language == "fr"  # Local override
@@ -49,13 +60,11 @@ def test_config_set_value(mock_config_paths):
     # Set a value in local config
     config.set_value("user.language", "de", scope="local")
 
-    # Reload config and verify
-    config = Config.load()
-    assert config.user.language == "de"
+    # Verify the loaded config
+    assert config.get_value("user.language") == "de"
 
     # Verify file contents
-    with open(mock_config_paths["local"], "r") as f:
-        saved_config = yaml.safe_load(f)
+    saved_config = load_yaml(mock_config_paths["local"].read_bytes())
     assert saved_config["user"]["language"] == "de"
 
 
@@ -75,12 +84,49 @@ def test_config_type_validation(mock_config_paths):
     # Test valid values
     config.set_value("ai.temperature", 0.8)
 
-    # Reload config and verify
-    config = Config.load()
-    assert config.ai.temperature == 0.8
+    # Verify the loaded config
+    assert config.get_value("ai.temperature") == 0.8
 
     # Test invalid values
     with pytest.raises(ValueError):
         config.set_value("ai.temperature", 2.0)  # Out of range
     with pytest.raises(ValueError):
         config.set_value("ai.max_tokens", -1)  # Invalid value
+
+
+def test_config_set_value_updates_instance(mock_config_paths):
+    """Test that setting a value updates the instance without reloading."""
+    config = Config.load()
+    config.set_value("ai.max_tokens", 1000)
+    assert config.ai.max_tokens == 1000
+
+    # Invalid values are rejected before anything is written
+    with pytest.raises(ValueError):
+        config.set_value("ai.max_tokens", -1)
+    assert config.ai.max_tokens == 1000
+    assert Config.load().ai.max_tokens == 1000
+
+
+def test_config_set_value_global_shadowed_by_local_section(mock_config_paths):
+    """Test that a global change stays hidden when the local config defines the section."""
+    _write_configs(mock_config_paths, global_yaml="", local_yaml="user:\n  language: fr\n")
+    config = Config.load()
+
+    config.set_value("user.emoji_enabled", False, scope="global")
+    assert config.user.emoji_enabled is Config.load().user.emoji_enabled is True
+
+
+def test_config_set_value_refreshes_file_cache(mock_config_paths):
+    """Test that a write with the same mtime and size is not shadowed by the cache."""
+    config = Config.load()
+    config.set_value("user.language", "de")
+    path = mock_config_paths["local"]
+    mtime = path.stat().st_mtime_ns
+
+    # Same size and timestamp as the previous write, as on a coarse-grained filesystem
+    config.set_value("user.language", "fr")
+    os.utime(path, ns=(mtime, mtime))
+
+    config.set_value("ai.max_tokens", 1000)
+    saved_config = load_yaml(path.read_bytes())
+    assert saved_config["user"]["language"] == "fr"
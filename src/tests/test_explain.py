@@ -0,0 +1,30 @@
+import asyncio
+
+from conftest import StubAsyncInferenceClient
+from gas.commands.explain import _explain_parallel
+from gas.core.config import config
+from gas.core.git import get_changed_files, split_hunks
+
+
+def test_explain_parallel(ai_client, sample_diff, monkeypatch):
+    """Test summarizing files concurrently, labelled with their paths."""
+    monkeypatch.setattr(config.ai, "max_concurrency", 2)
+    paths = [f"src/module{i}.py" for i in range(4)]
+    hunks = split_hunks("".join(sample_diff.replace("src/main.py", path) for path in paths))
+
+    stub = StubAsyncInferenceClient()
+    stub.respond = lambda prompt: f"Changed {get_changed_files(prompt)[0]}"
+    ai_client._async_client = stub
+
+    summaries = asyncio.run(_explain_parallel(ai_client, hunks))
+
+    assert summaries == [f"File {path}:\nChanged {path}" for path in paths]
+    assert len(stub.prompts) == 4
+    assert stub.max_active == 2  # Bounded by max_concurrency
+    assert ai_client._async_client is None  # Closed once done
+
+    # Summaries are cached, so a second run doesn't send any request
+    stub = StubAsyncInferenceClient()
+    ai_client._async_client = stub
+    assert asyncio.run(_explain_parallel(ai_client, hunks)) == summaries
+    assert stub.prompts == []
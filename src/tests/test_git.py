@@ -0,0 +1,130 @@
+from gas.core.git import (
+    get_changed_files,
+    get_renamed_files,
+    is_import_reorder_only,
+    is_whitespace_only,
+    split_hunks,
+    truncate_diff,
+)
+
+
+def test_split_hunks(sample_diff):
+    """Test splitting a diff into one hunk per file."""
+    other = sample_diff.replace("src/main.py", "src/other.py")
+    hunks = split_hunks(sample_diff + other)
+
+    assert len(hunks) == 2
+    assert hunks[0].startswith("diff --git a/src/main.py")
+    assert hunks[1].startswith("diff --git a/src/other.py")
+
+
+def test_truncate_diff(sample_diff):
+    """Test truncating a diff at a line boundary."""
+    assert truncate_diff(sample_diff, 0) == sample_diff
+    assert truncate_diff(sample_diff, len(sample_diff)) == sample_diff
+
+    truncated = truncate_diff(sample_diff, 60)
+    kept, _ = truncated.split("\n[diff truncated]")
+    assert len(kept) <= 60
+    assert sample_diff.startswith(kept)
+    assert kept.endswith("\n")
+
+
+def test_renamed_files():
+    """Test detecting diffs that only rename files."""
+    diff = """diff --git a/old.py b/new.py
+similarity index 100%
+rename from old.py
+rename to new.py"""
+
+    assert get_renamed_files(diff) == [("old.py", "new.py")]
+    assert get_changed_files(diff) == ["new.py"]
+
+
+def test_whitespace_only(sample_diff):
+    """Test detecting diffs that only change whitespace."""
+    diff = """diff --git a/src/main.py b/src/main.py
+--- a/src/main.py
++++ b/src/main.py
+@@ -1,2 +1,2 @@
+-def main():\t
++def main():
+     pass"""
+
+    assert is_whitespace_only(diff)
+    assert not is_whitespace_only(sample_diff)
+    assert get_renamed_files(sample_diff) == []
+
+    # Indentation and whitespace inside lines are significant
+    dedent = """diff --git a/src/main.py b/src/main.py
+--- a/src/main.py
++++ b/src/main.py
+@@ -1,3 +1,3 @@
+ for item in items:
+     result.append(item)
+-    return result
++return result"""
+    literal = """diff --git a/src/main.py b/src/main.py
+--- a/src/main.py
++++ b/src/main.py
+@@ -1 +1 @@
+-greeting = 'hello world'
++greeting = 'helloworld'"""
+
+    # Moved lines are not whitespace changes
+    swap = """diff --git a/app.py b/app.py
+--- a/app.py
++++ b/app.py
+@@ -1,3 +1,3 @@
+ def save(db):
+-    db.commit()
+     db.close()
++    db.commit()"""
+    cross_hunk = """diff --git a/app.py b/app.py
+--- a/app.py
++++ b/app.py
+@@ -1,3 +1,2 @@
+ def f():
+-    check_auth()
+     run()
+@@ -10,2 +9,3 @@
+ def g():
++    check_auth()
+     run()"""
+
+    assert not is_whitespace_only(dedent)
+    assert not is_whitespace_only(literal)
+    assert not is_whitespace_only(swap)
+    assert not is_whitespace_only(cross_hunk)
+
+
+def test_import_reorder_only(sample_diff):
+    """Test detecting diffs that only reorder imports."""
+    diff = """diff --git a/src/main.py b/src/main.py
+--- a/src/main.py
++++ b/src/main.py
+@@ -1,2 +1,2 @@
+-import sys
+ import os
++import sys"""
+
+    assert is_import_reorder_only(diff)
+    assert not is_whitespace_only(diff)
+    assert not is_import_reorder_only(sample_diff)
+
+    # Moving an import to another file is not a reorder
+    moved = """diff --git a/a.py b/a.py
+--- a/a.py
++++ b/a.py
+@@ -1,2 +1 @@
+-import os
+ import sys
+diff --git a/b.py b/b.py
+--- a/b.py
++++ b/b.py
+@@ -1 +1,2 @@
++import os
+ import sys"""
+
+    assert not is_import_reorder_only(moved)
+    assert not is_whitespace_only(moved)
@@ -1,35 +1,37 @@
-from gas.commands.explain import _build_explanation_prompt
-from gas.commands.commit import _build_commit_prompt
+import re
 
+import pytest
 
-def test_explanation_prompt_english():
-    """Test explanation prompt in English."""
+from gas.commands.explain import _build_explanation_prompt
+from gas.commands.commit import _build_commit_prompt
 
-    diff = """diff --git a/src/main.py b/src/main.py
+SAMPLE_DIFF = """diff --git a/src/main.py b/src/main.py
 @@ -1,3 +1,4 @@
 +import sys
  def hello():
 -    print("Hello")
-+    print("Hello, World!")
-"""
-
-    prompt = _build_explanation_prompt(diff, detailed=False, language="en")
-    assert "you are an expert git assistant." in prompt.lower()
-    assert "language prompt" not in prompt.lower()  # No language prompt for English
++    print("Hello, World!")"""
 
+_CONV_RE = re.compile(
+    r"conventional commit format.*feat\(\[scope\]\): description", re.IGNORECASE | re.DOTALL
+)
 
-def test_explanation_prompt_spanish():
-    """Test explanation prompt in Spanish."""
-    diff = """diff --git a/src/main.py b/src/main.py
-@@ -1,3 +1,4 @@
-+import sys
- def hello():
--    print("Hello")
-+    print("Hello, World!")"""
 
-    prompt = _build_explanation_prompt(diff, detailed=False, language="es")
-    assert "es" in prompt.lower()
-    assert diff in prompt
+@pytest.mark.parametrize(
+    "language,expect",
+    [
+        ("en", "you are an expert git assistant."),
+        ("es", "please respond in es"),
+        ("fr", "please respond in fr"),
+    ],
+)
+def test_explanation_prompt(language, expect):
+    """Test explanation prompt in different languages."""
+    prompt = _build_explanation_prompt(SAMPLE_DIFF, detailed=False, language=language)
+    lower = prompt.lower()
+    assert expect in lower
+    assert ("please respond in" in lower) == (language != "en")  # No language prompt for English
+    assert SAMPLE_DIFF in prompt
 
 
 def test_explanation_prompt_detailed():
@@ -43,34 +45,21 @@ def test_explanation_prompt_detailed():
     assert "detailed" in prompt_detailed.lower()
 
 
-def test_commit_prompt_english():
-    """Test commit message prompt in English."""
-
-    diff = """diff --git a/src/main.py b/src/main.py
-@@ -1,3 +1,4 @@
-+import sys
- def hello():
--    print("Hello")
-+    print("Hello, World!")"""
-
-    prompt = _build_commit_prompt(diff, language="en")
-    assert "generate a clear and concise commit message" in prompt.lower()
-    assert "language prompt" not in prompt.lower()  # No language prompt for English
-
-
-def test_commit_prompt_french():
-    """Test commit message prompt in French."""
-
-    diff = """diff --git a/src/main.py b/src/main.py
-@@ -1,3 +1,4 @@
-+import sys
- def hello():
--    print("Hello")
-+    print("Hello, World!")"""
-
-    prompt = _build_commit_prompt(diff, language="fr")
-    assert "fr" in prompt.lower()
-    assert diff in prompt
+@pytest.mark.parametrize(
+    "language,expect",
+    [
+        ("en", "generate a clear and concise commit message"),
+        ("es", "please respond in es"),
+        ("fr", "please respond in fr"),
+    ],
+)
+def test_commit_prompt(language, expect):
+    """Test commit message prompt in different languages."""
+    prompt = _build_commit_prompt(SAMPLE_DIFF, language=language)
+    lower = prompt.lower()
+    assert expect in lower
+    assert ("please respond in" in lower) == (language != "en")  # No language prompt for English
+    assert SAMPLE_DIFF in prompt
 
 
 def test_commit_prompt_conventional():
@@ -78,5 +67,4 @@ def test_commit_prompt_conventional():
     diff = "sample diff"
 
     prompt = _build_commit_prompt(diff, commit_type="feat")
-    assert "conventional commit format" in prompt.lower()
-    assert "feat([scope]): description" in prompt.lower()
+    assert _CONV_RE.search(prompt)